@@ -13,7 +13,15 @@ from airq.models.zipcodes import Zipcode
 class BaseQualityCommand(RegexCommand):
     def handle(self) -> MessageResponse:
         if self.params.get("zipcode"):
-            zipcode = Zipcode.query.get_by_zipcode(self.params["zipcode"])
+            # Most people text the zipcode they're already subscribed to,
+            # which we can load through the client's relationship by primary key.
+            if (
+                self.client.zipcode is not None
+                and self.client.zipcode.zipcode == self.params["zipcode"]
+            ):
+                zipcode = self.client.zipcode
+            else:
+                zipcode = Zipcode.query.get_by_zipcode(self.params["zipcode"])
             if zipcode is None:
                 return MessageResponse(
                     body=gettext(
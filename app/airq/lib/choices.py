@@ -14,6 +14,17 @@ class ChoicesEnum(enum.Enum):
 
     @classmethod
     def from_value(cls: typing.Type[T], value: typing.Any) -> T:
+        # This runs on every read of a choices pref, so go straight to the
+        # enum's value map and only fall back to the (slower) constructor
+        # when the value isn't a known member, e.g. to raise a ValueError.
+        try:
+            member = cls._value2member_map_.get(value)
+        except TypeError:
+            # Unhashable value; let the constructor raise its usual ValueError.
+            pass
+        else:
+            if member is not None:
+                return typing.cast(T, member)
         return cls(value)
 
 
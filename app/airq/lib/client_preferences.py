@@ -1,5 +1,4 @@
 import abc
-import collections
 import typing
 
 from flask_babel import gettext
@@ -37,6 +36,7 @@ class ClientPreference(abc.ABC, typing.Generic[TPreferenceValue]):
         self.display_name = display_name
         self.description = description
         self.default: TPreferenceValue = default
+        self._name: typing.Optional[str] = None
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.name}, {self.display_name}, {self.description}, {self.default})"
@@ -44,13 +44,16 @@ class ClientPreference(abc.ABC, typing.Generic[TPreferenceValue]):
     def __get__(
         self, instance: "Client", owner: typing.Type["Client"]
     ) -> TPreferenceValue:
-        if instance is not None:
-            preferences = instance.preferences or {}
-            value = preferences.get(self.name)
+        if instance is None:
+            return self
+        # Prefs are read on nearly every request, so keep this path lean:
+        # don't allocate an empty dict and read the name set by __set_name__.
+        preferences = instance.preferences
+        if preferences:
+            value = preferences.get(self._name)
             if value is not None:
                 return self._cast(value)
-            return self.default
-        return self
+        return self.default
 
     def __set__(self, client: "Client", value: TPreferenceValue):
         self._set(client, value)
@@ -75,6 +78,9 @@ class ClientPreference(abc.ABC, typing.Generic[TPreferenceValue]):
         self._validate(value)
         if client.preferences is None:
             client.preferences = {}
+        elif client.preferences.get(self.name) == value:
+            # Don't rewrite the whole preferences blob if nothing changed.
+            return
         client.preferences[self.name] = value  # type: ignore
         # SQLAlchemy doesn't pick up changes to JSON fields,
         # so we have to tell it what's going on. See
@@ -85,6 +91,7 @@ class ClientPreference(abc.ABC, typing.Generic[TPreferenceValue]):
 
     def __set_name__(self, owner: typing.Type["Client"], name: str) -> None:
         ClientPreferencesRegistry.register_pref(name, self)
+        self._name = name
 
     @abc.abstractmethod
     def _cast(self, value: typing.Any) -> TPreferenceValue:
@@ -92,7 +99,9 @@ class ClientPreference(abc.ABC, typing.Generic[TPreferenceValue]):
 
     @property
     def name(self) -> str:
-        return ClientPreferencesRegistry.get_name(self)
+        if self._name is None:
+            return ClientPreferencesRegistry.get_name(self)
+        return self._name
 
     @abc.abstractmethod
     def clean(self, value: str) -> typing.Optional[TPreferenceValue]:
@@ -121,9 +130,10 @@ class ChoicesPreference(typing.Generic[TChoicesEnum], ClientPreference[TChoicesE
     ):
         super().__init__(display_name, description, default)
         self._choices = choices
+        self._choices_tuple: typing.Tuple[TChoicesEnum, ...] = tuple(choices)
 
-    def _get_choices(self) -> typing.List[TChoicesEnum]:
-        return list(self._choices)
+    def _get_choices(self) -> typing.Tuple[TChoicesEnum, ...]:
+        return self._choices_tuple
 
     def _cast(self, value: typing.Any) -> TChoicesEnum:
         return self._choices.from_value(value)
@@ -132,14 +142,13 @@ class ChoicesPreference(typing.Generic[TChoicesEnum], ClientPreference[TChoicesE
         return value.display
 
     def clean(self, user_input: str) -> typing.Optional[TChoicesEnum]:
+        if not user_input.isdecimal():
+            return None
         choices = self._get_choices()
-        try:
-            idx = int(user_input)
-            if idx <= 0:
-                return None
-            return choices[idx - 1]
-        except (IndexError, TypeError, ValueError):
+        idx = int(user_input)
+        if idx <= 0 or idx > len(choices):
             return None
+        return choices[idx - 1]
 
     def _validate(self, _value: TChoicesEnum):
         pass  # Valid by definition
@@ -185,18 +194,25 @@ class IntegerPreference(ClientPreference[int]):
         return value
 
     def clean(self, user_input: str) -> typing.Optional[int]:
-        try:
-            value = int(user_input)
-            self._validate(value)
-        except (TypeError, ValueError, InvalidPrefValue):
+        # Accept an optional sign, as int() does.
+        digits = user_input[1:] if user_input[:1] in ("+", "-") else user_input
+        if not digits.isdecimal():
+            return None
+        value = int(user_input)
+        if not self._is_in_range(value):
             return None
         return value
 
     def _validate(self, value: int):
-        if self._min_value is not None and value < self._min_value:
+        if not self._is_in_range(value):
             raise InvalidPrefValue()
+
+    def _is_in_range(self, value: int) -> bool:
+        if self._min_value is not None and value < self._min_value:
+            return False
         if self._max_value is not None and value > self._max_value:
-            raise InvalidPrefValue()
+            return False
+        return True
 
     def get_prompt(self) -> str:
         if self._min_value is not None and self._max_value is not None:
@@ -219,7 +235,8 @@ class IntegerPreference(ClientPreference[int]):
 
 
 class ClientPreferencesRegistry:
-    _prefs: typing.MutableMapping[str, ClientPreference] = collections.OrderedDict()
+    _prefs: typing.Dict[str, ClientPreference] = {}
+    _prefs_list: typing.List[ClientPreference] = []
 
     @classmethod
     def register_pref(cls, name: str, pref: ClientPreference) -> None:
@@ -227,9 +244,12 @@ class ClientPreferencesRegistry:
         if name in cls._prefs:
             raise RuntimeError("Can't double-register pref {}".format(pref.name))
         cls._prefs[name] = pref
+        cls._prefs_list.append(pref)
 
     @classmethod
     def get_name(cls, pref: ClientPreference) -> str:
+        if pref._name is not None:
+            return pref._name
         for name, p in cls._prefs.items():
             if p is pref:
                 return name
@@ -245,11 +265,10 @@ class ClientPreferencesRegistry:
 
     @classmethod
     def iter_with_index(cls) -> typing.Iterator[typing.Tuple[int, ClientPreference]]:
-        return enumerate(cls._prefs.values(), start=1)
+        return enumerate(cls._prefs_list, start=1)
 
     @classmethod
     def get_by_index(cls, index: int) -> typing.Optional[ClientPreference]:
-        for i, pref in cls.iter_with_index():
-            if i == index:
-                return pref
+        if 1 <= index <= len(cls._prefs_list):
+            return cls._prefs_list[index - 1]
         return None
@@ -1,4 +1,21 @@
 import math
+import operator
+import typing
+
+import numpy as np
+
+
+# Names of the columns that store each character of a model's geohash.
+GEOHASH_BIT_NAMES = tuple(f"geohash_bit_{i}" for i in range(1, 13))
+
+_get_geohash_bits = operator.attrgetter(*GEOHASH_BIT_NAMES)
+
+
+def get_geohash(obj: typing.Any) -> str:
+    """
+    Join the geohash bit columns of a zipcode or sensor into its geohash
+    """
+    return "".join(_get_geohash_bits(obj))
 
 
 def haversine_distance(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
@@ -7,16 +24,34 @@ def haversine_distance(lon1: float, lat1: float, lon2: float, lat2: float) -> fl
     on the earth (specified in decimal degrees)
     """
     # convert decimal degrees to radians
-    lon1, lat1, lon2, lat2 = map(math.radians, [lon1, lat1, lon2, lat2])
+    radians = math.radians
+    lon1, lat1, lon2, lat2 = radians(lon1), radians(lat1), radians(lon2), radians(lat2)
+
+    # haversine formula
+    sin_dlon = math.sin((lon2 - lon1) / 2)
+    sin_dlat = math.sin((lat2 - lat1) / 2)
+    a = sin_dlat * sin_dlat + math.cos(lat1) * math.cos(lat2) * sin_dlon * sin_dlon
+    c = 2 * math.asin(math.sqrt(a))
+    r = 6371  # Radius of earth in kilometers. Use 3956 for miles
+    return c * r
+
+
+def haversine_distances(
+    lon1: float, lat1: float, lon2: np.ndarray, lat2: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate the great circle distances between one point and an
+    array of points on the earth (specified in decimal degrees)
+    """
+    # convert decimal degrees to radians
+    lon1, lat1 = math.radians(lon1), math.radians(lat1)
+    lon2, lat2 = np.radians(lon2), np.radians(lat2)
 
     # haversine formula
     dlon = lon2 - lon1
     dlat = lat2 - lat1
-    a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-    )
-    c = 2 * math.asin(math.sqrt(a))
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    c = 2 * np.arcsin(np.sqrt(a))
     r = 6371  # Radius of earth in kilometers. Use 3956 for miles
     return c * r
 
@@ -1,3 +1,4 @@
+import bisect
 import dataclasses
 import enum
 import math
@@ -48,18 +49,7 @@ class Pm25(IntChoicesEnum):
 
     @classmethod
     def from_measurement(cls, measurement: float) -> "Pm25":
-        if measurement < cls.MODERATE:
-            return cls.GOOD
-        if measurement < cls.UNHEALTHY_FOR_SENSITIVE_GROUPS:
-            return cls.MODERATE
-        if measurement < cls.UNHEALTHY:
-            return cls.UNHEALTHY_FOR_SENSITIVE_GROUPS
-        if measurement < cls.VERY_UNHEALTHY:
-            return cls.UNHEALTHY
-        if measurement < cls.HAZARDOUS:
-            return cls.VERY_UNHEALTHY
-
-        return cls.HAZARDOUS
+        return _PM25_LEVELS[bisect.bisect_right(_PM25_CUTOFFS, measurement)]
 
     @property
     def display(self) -> str:
@@ -104,10 +94,19 @@ class Pm25(IntChoicesEnum):
             )
 
 
+# Each level's lower bound, excluding GOOD's, in ascending order.
+_PM25_LEVELS = tuple(Pm25)
+_PM25_CUTOFFS = tuple(level.value for level in _PM25_LEVELS[1:])
+
+
 @dataclasses.dataclass
 class Readings:
     """Encapsulates a set of readings from PurpleAir."""
 
+    # We build one of these per zipcode whenever we compare air quality,
+    # so skip the per-instance __dict__.
+    __slots__ = ("pm25", "pm_cf_1", "humidity")
+
     pm25: float
     pm_cf_1: typing.Optional[float]
     humidity: typing.Optional[float]
@@ -125,21 +124,26 @@ class Readings:
         return _pm25_to_aqi(self.get_pm25(conversion_stragy))
 
 
+# (concentration low, concentration high, AQI low, AQI high) for each AQI
+# category, per the EPA's piecewise-linear pm25 breakpoints.
+_AQI_BREAKPOINTS = (
+    (0.0, 12.0, 0, 50),
+    (12.1, 35.4, 51, 100),
+    (35.5, 55.4, 101, 150),
+    (55.5, 150.4, 151, 200),
+    (150.5, 250.4, 201, 300),
+    (250.5, 350.4, 301, 400),
+    (350.5, 500.0, 401, 500),
+)
+_AQI_CONCENTRATION_CUTOFFS = tuple(bp[0] for bp in _AQI_BREAKPOINTS[1:])
+
+
 def _pm25_to_aqi(concentration: float) -> int:
-    if 350.5 < concentration:
-        return _linear(500, 401, 500, 350.5, concentration)
-    elif 250.5 < concentration:
-        return _linear(400, 301, 350.4, 250.5, concentration)
-    elif 150.5 < concentration:
-        return _linear(300, 201, 250.4, 150.5, concentration)
-    elif 55.5 < concentration:
-        return _linear(200, 151, 150.4, 55.5, concentration)
-    elif 35.5 < concentration:
-        return _linear(150, 101, 55.4, 35.5, concentration)
-    elif 12.1 < concentration:
-        return _linear(100, 51, 35.4, 12.1, concentration)
-    else:
-        return _linear(50, 0, 12, 0, concentration)
+    # A concentration belongs to the last category whose lower bound it exceeds.
+    conc_low, conc_high, aqi_low, aqi_high = _AQI_BREAKPOINTS[
+        bisect.bisect_left(_AQI_CONCENTRATION_CUTOFFS, concentration)
+    ]
+    return _linear(aqi_high, aqi_low, conc_high, conc_low, concentration)
 
 
 def _linear(
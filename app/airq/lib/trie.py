@@ -29,8 +29,34 @@ class Trie(typing.Generic[T]):
         curr = self._root
         for c in prefix:
             curr = curr.children.get(c, TrieNode())
+        return self._collect([curr])
+
+    def iter_prefixes(self, key: str) -> typing.Iterator[typing.List[T]]:
+        """
+        Yields the values under each prefix of key, from longest to shortest,
+        excluding any values already yielded for a longer prefix. Prefixes that
+        aren't in the trie are skipped.
+
+        Equivalent to calling `get` on each prefix and filtering out values
+        that have been seen before, but walks the trie only once.
+        """
+        path = [self._root]
+        for c in key:
+            node = path[-1].children.get(c)
+            if node is None:
+                break
+            path.append(node)
+
+        seen: typing.Optional[str] = None
+        for depth in range(len(path) - 1, 0, -1):
+            node = path[depth]
+            stack = [child for c, child in node.children.items() if c != seen]
+            yield node.values + self._collect(stack)
+            seen = key[depth - 1]
+
+    @staticmethod
+    def _collect(stack: typing.List[TrieNode[T]]) -> typing.List[T]:
         results = []
-        stack = [curr]
         while stack:
             curr = stack.pop()
             results.extend(curr.values)
@@ -6,9 +6,8 @@ import typing
 from flask_babel import gettext
 from flask_babel import lazy_gettext
 from flask_sqlalchemy import BaseQuery
-from sqlalchemy import and_
 from sqlalchemy import func
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 from twilio.base.exceptions import TwilioRestException
 
 from airq.config import db
@@ -81,23 +80,24 @@ class ClientQuery(BaseQuery):
     def filter_eligible_for_sending(self) -> "ClientQuery":
         return (
             self.filter_phones()
-            .options(joinedload(Client.zipcode))
+            .options(selectinload(Client.zipcode).selectinload(Zipcode.city))
             .filter(Client.alerts_disabled_at == 0)
             .filter(Client.zipcode_id.isnot(None))
         )
 
     def filter_eligible_for_share_requests(self) -> "ClientQuery":
-        subq = (
-            Event.query.filter(Event.type_code == EventType.SHARE_REQUEST)
+        # Anti-join against recent share requests. Postgres can answer
+        # NOT EXISTS with a single index probe per client rather than
+        # materializing every recent share request and joining against it.
+        recent_share_requests = (
+            Event.query.filter(Event.client_id == Client.id)
+            .filter(Event.type_code == EventType.SHARE_REQUEST)
             .filter(Event.timestamp > Client.get_share_request_cutoff())
-            .with_entities(Event.client_id, Event.timestamp)
-            .subquery()
         )
         share_window_start, share_window_end = Client.get_share_window()
         return (
             self.filter_phones()
-            .outerjoin(subq, and_(subq.c.client_id == Client.id))
-            .filter(subq.c.timestamp == None)
+            .filter(~recent_share_requests.exists())
             # Client must have signed up more than 7 days ago
             .filter(Client.created_at < now() - datetime.timedelta(days=7))
             .filter(Client.last_alert_sent_at > share_window_start)
@@ -112,6 +112,15 @@ class Event(db.Model):  # type: ignore
     )
     json_data = db.Column(db.JSON(), nullable=False)
 
+    __table_args__ = (
+        # Serves the "latest event for this client" lookups.
+        db.Index(
+            "ix_events_client_id_timestamp",
+            client_id,
+            timestamp.desc(),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Event {self.type_code}>"
 
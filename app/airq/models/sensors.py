@@ -1,6 +1,7 @@
 from flask_sqlalchemy import BaseQuery
 
 from airq.config import db
+from airq.lib.geo import get_geohash
 
 
 class SensorQuery(BaseQuery):
@@ -45,4 +46,4 @@ class Sensor(db.Model):  # type: ignore
 
     @property
     def geohash(self) -> str:
-        return "".join([getattr(self, f"geohash_bit_{i}") for i in range(1, 13)])
+        return get_geohash(self)
@@ -1,9 +1,11 @@
 import dataclasses
+import heapq
 import typing
 
 from flask_sqlalchemy import BaseQuery
 
 from airq.lib.clock import timestamp
+from airq.lib.geo import get_geohash
 from airq.lib.geo import haversine_distance
 from airq.lib.readings import ConversionStrategy
 from airq.lib.readings import Pm25
@@ -13,15 +15,41 @@ from airq.config import db
 
 @dataclasses.dataclass
 class ZipcodeMetrics:
+    __slots__ = (
+        "num_sensors",
+        "min_sensor_distance",
+        "max_sensor_distance",
+        "sensor_ids",
+    )
+
     num_sensors: int
     min_sensor_distance: int
     max_sensor_distance: int
     sensor_ids: typing.List[int]
 
 
+# Maps zipcodes to their IDs so that repeat lookups can fetch by primary key
+# instead of by the zipcode's unique index. Each request gets a fresh session,
+# so this is usually still a SELECT; it only skips the database when the row
+# is already in the session's identity map.
+_zipcode_ids: typing.Dict[str, int] = {}
+
+
 class ZipcodeQuery(BaseQuery):
     def get_by_zipcode(self, zipcode: str) -> typing.Optional["Zipcode"]:
-        return self.filter_by(zipcode=zipcode).first()
+        zipcode_id = _zipcode_ids.get(zipcode)
+        if zipcode_id is not None:
+            obj = self.get(zipcode_id)
+            # Zipcode IDs shouldn't change once created, but if the row was
+            # deleted or its ID reused, fall back to looking it up again.
+            if obj is not None and obj.zipcode == zipcode:
+                return obj
+        obj = self.filter_by(zipcode=zipcode).first()
+        if obj is not None:
+            _zipcode_ids[zipcode] = obj.id
+        else:
+            _zipcode_ids.pop(zipcode, None)
+        return obj
 
 
 class Zipcode(db.Model):  # type: ignore
@@ -96,7 +124,7 @@ class Zipcode(db.Model):  # type: ignore
     @property
     def geohash(self) -> str:
         """This zipcode's geohash."""
-        return "".join([getattr(self, f"geohash_bit_{i}") for i in range(1, 13)])
+        return get_geohash(self)
 
     @classmethod
     def pm25_stale_cutoff(cls) -> float:
@@ -145,10 +173,10 @@ class Zipcode(db.Model):  # type: ignore
 
         # TODO: Make this faster somehow?
         curr_pm25_level = self.get_pm25_level(conversion_strategy)
-        zipcodes = [
+        zipcodes = (
             z
             for z in Zipcode.query.filter(Zipcode.pm25_updated_at > cutoff).all()
             if z.get_pm25_level(conversion_strategy) < curr_pm25_level
-        ]
+        )
 
-        return sorted(zipcodes, key=lambda z: self.distance(z))[:num_desired]
+        return heapq.nsmallest(num_desired, zipcodes, key=self.distance)
@@ -1,8 +1,10 @@
 import collections
+import decimal
 import geohash
 import json
 import logging
 import math
+import numpy as np
 import requests
 import typing
 
@@ -11,7 +13,8 @@ from flask_babel import force_locale
 from airq.celery import get_celery_logger
 from airq.config import db
 from airq.lib.clock import timestamp
-from airq.lib.geo import haversine_distance
+from airq.lib.geo import GEOHASH_BIT_NAMES
+from airq.lib.geo import haversine_distances
 from airq.lib.purpleair import call_purpleair_data_api
 from airq.lib.purpleair import call_purpleair_sensors_api
 from airq.lib.trie import Trie
@@ -190,11 +193,17 @@ def _sensors_sync(
 def _relations_sync(moved_sensor_ids: typing.List[int]):
     logger = get_celery_logger()
 
-    trie: Trie[Zipcode] = Trie()
-    for zipcode in Zipcode.query.all():
-        trie.insert(zipcode.geohash, zipcode)
+    # We only need each zipcode's location, so skip building full ORM objects.
+    trie: Trie[typing.Tuple[int, decimal.Decimal, decimal.Decimal]] = Trie()
+    for zipcode_id, latitude, longitude, *geohash_bits in Zipcode.query.with_entities(
+        Zipcode.id,
+        Zipcode.latitude,
+        Zipcode.longitude,
+        *(getattr(Zipcode, name) for name in GEOHASH_BIT_NAMES),
+    ):
+        trie.insert("".join(geohash_bits), (zipcode_id, latitude, longitude))
 
-    new_relations = []
+    new_relations: typing.List[SensorZipcodeRelation] = []
 
     # Delete the old relations before rebuilding them
     deleted_relations_count = SensorZipcodeRelation.query.filter(
@@ -204,43 +213,38 @@ def _relations_sync(moved_sensor_ids: typing.List[int]):
 
     sensors = Sensor.query.filter(Sensor.id.in_(moved_sensor_ids)).all()
     for sensor in sensors:
-        gh = sensor.geohash
         latitude = sensor.latitude
         longitude = sensor.longitude
-        done = False
-        zipcode_ids: typing.Set[int] = set()
+        num_relations = 0
         # TODO: Use Postgres' native geolocation extension.
-        while gh and not done:
-            zipcodes = [
-                zipcode for zipcode in trie.get(gh) if zipcode.id not in zipcode_ids
-            ]
-
-            for zipcode_id, distance in sorted(
-                [
-                    (
-                        z.id,
-                        haversine_distance(
-                            longitude, latitude, z.longitude, z.latitude
-                        ),
-                    )
-                    for z in zipcodes
-                ],
-                key=lambda t: t[1],
-            ):
-                if distance >= 25:
-                    done = True
-                    break
-                if len(zipcode_ids) >= 25:
-                    done = True
-                    break
-                zipcode_ids.add(zipcode_id)
-                data = {
-                    "zipcode_id": zipcode_id,
-                    "sensor_id": sensor.id,
-                    "distance": distance,
-                }
-                new_relations.append(SensorZipcodeRelation(**data))
-            gh = gh[:-1]
+        for zipcodes in trie.iter_prefixes(sensor.geohash):
+            distances = haversine_distances(
+                longitude,
+                latitude,
+                np.fromiter(
+                    (z[2] for z in zipcodes), dtype=np.float64, count=len(zipcodes)
+                ),
+                np.fromiter(
+                    (z[1] for z in zipcodes), dtype=np.float64, count=len(zipcodes)
+                ),
+            )
+
+            # Take the nearest zipcodes within 25km, up to 25 in total, and stop
+            # widening the prefix as soon as any candidate gets left out.
+            order = np.argsort(distances, kind="stable")
+            num_nearby = int(np.searchsorted(distances[order], 25))
+            nearest = order[: min(num_nearby, 25 - num_relations)]
+            new_relations.extend(
+                SensorZipcodeRelation(
+                    zipcode_id=zipcodes[i][0],
+                    sensor_id=sensor.id,
+                    distance=float(distances[i]),
+                )
+                for i in nearest
+            )
+            num_relations += len(nearest)
+            if len(nearest) < len(order):
+                break
 
     if new_relations:
         logger.info("Creating %s relations", len(new_relations))
@@ -0,0 +1,29 @@
+"""Add events client_id timestamp index
+
+Revision ID: 79a3333845f3
+Revises: 7de8a31a8e57
+Create Date: 2026-10-15 09:12:44.318206
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "79a3333845f3"
+down_revision = "7de8a31a8e57"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_events_client_id_timestamp",
+        "events",
+        ["client_id", sa.text("timestamp DESC")],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_events_client_id_timestamp", table_name="events")
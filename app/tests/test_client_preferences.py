@@ -1,7 +1,10 @@
+from airq.lib.client_preferences import ClientPreferencesRegistry
 from airq.lib.client_preferences import IntegerChoicesPreference
+from airq.lib.client_preferences import IntegerPreference
 from airq.lib.client_preferences import StringChoicesPreference
 from airq.lib.readings import ConversionStrategy
 from airq.lib.readings import Pm25
+from airq.models.clients import Client
 from tests.base import BaseTestCase
 
 
@@ -19,6 +22,8 @@ class IntegerChoicesPreferenceTestCase(BaseTestCase):
         pref = self._get_pref()
         self.assertIsNone(pref.clean("0"))
         self.assertIsNone(pref.clean("20"))
+        self.assertIsNone(pref.clean("-1"))
+        self.assertIsNone(pref.clean("foo"))
         self.assertEqual(0, pref.clean("1"))
         self.assertEqual(12, pref.clean("2"))
 
@@ -61,3 +66,43 @@ class StringChoicesPreferenceTestCase(BaseTestCase):
             "2 - {}".format(ConversionStrategy.US_EPA.display),
             pref.get_prompt(),
         )
+
+
+class IntegerPreferenceTestCase(BaseTestCase):
+    @staticmethod
+    def _get_pref() -> IntegerPreference:
+        return IntegerPreference(
+            display_name="Foo Bar",
+            description="Testing 123",
+            default=2,
+            min_value=0,
+            max_value=24,
+        )
+
+    def test_clean(self):
+        pref = self._get_pref()
+        self.assertIsNone(pref.clean(""))
+        self.assertIsNone(pref.clean("-"))
+        self.assertIsNone(pref.clean("-1"))
+        self.assertIsNone(pref.clean("25"))
+        self.assertIsNone(pref.clean("foo"))
+        self.assertEqual(0, pref.clean("0"))
+        self.assertEqual(24, pref.clean("24"))
+        self.assertEqual(5, pref.clean("+5"))
+        self.assertIsNone(pref.clean("+"))
+        self.assertIsNone(pref.clean("+-5"))
+
+
+class ClientPreferencesRegistryTestCase(BaseTestCase):
+    def test_get_name(self):
+        self.assertEqual(
+            "alert_frequency",
+            ClientPreferencesRegistry.get_name(Client.alert_frequency),
+        )
+        self.assertEqual("alert_threshold", Client.alert_threshold.name)
+
+    def test_get_by_index(self):
+        self.assertIsNone(ClientPreferencesRegistry.get_by_index(0))
+        for i, pref in ClientPreferencesRegistry.iter_with_index():
+            self.assertIs(pref, ClientPreferencesRegistry.get_by_index(i))
+        self.assertIsNone(ClientPreferencesRegistry.get_by_index(i + 1))
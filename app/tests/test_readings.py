@@ -1,4 +1,5 @@
 from airq.lib.readings import ConversionStrategy
+from airq.lib.readings import Pm25
 from airq.lib.readings import Readings
 from airq.lib.readings import _pm25_to_aqi
 from tests.base import BaseTestCase
@@ -34,3 +35,24 @@ class ReadingsTestCase(BaseTestCase):
                 )
             ),
         )
+
+    def test_pm25_from_measurement(self):
+        self.assertEqual(Pm25.GOOD, Pm25.from_measurement(0))
+        self.assertEqual(Pm25.GOOD, Pm25.from_measurement(11.9))
+        self.assertEqual(Pm25.MODERATE, Pm25.from_measurement(12))
+        self.assertEqual(Pm25.MODERATE, Pm25.from_measurement(34.9))
+        self.assertEqual(Pm25.UNHEALTHY_FOR_SENSITIVE_GROUPS, Pm25.from_measurement(35))
+        self.assertEqual(Pm25.UNHEALTHY, Pm25.from_measurement(55))
+        self.assertEqual(Pm25.VERY_UNHEALTHY, Pm25.from_measurement(150))
+        self.assertEqual(Pm25.VERY_UNHEALTHY, Pm25.from_measurement(249.9))
+        self.assertEqual(Pm25.HAZARDOUS, Pm25.from_measurement(250))
+        self.assertEqual(Pm25.HAZARDOUS, Pm25.from_measurement(1000))
+
+    def test_from_value(self):
+        self.assertIs(Pm25.MODERATE, Pm25.from_value(12))
+        self.assertIs(
+            ConversionStrategy.US_EPA, ConversionStrategy.from_value("US EPA")
+        )
+        for value in (13, [1], {}):
+            with self.assertRaises(ValueError):
+                Pm25.from_value(value)
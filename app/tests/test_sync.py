@@ -1,9 +1,13 @@
+import math
 import os
 import logging
+import typing
 
 from requests.exceptions import HTTPError
 from unittest import mock
 
+from airq.config import db
+from airq.lib.geo import GEOHASH_BIT_NAMES
 from airq.lib.purpleair import PURPLEAIR_DATA_API_URL
 from airq.lib.purpleair import PURPLEAIR_SENSORS_API_URL
 from airq.models.cities import City
@@ -13,6 +17,7 @@ from airq.models.zipcodes import Zipcode
 from airq.sync import models_sync
 from airq.sync.geonames import GEONAMES_URL
 from airq.sync.geonames import ZIP_2_TIMEZONES_URL
+from airq.sync.purpleair import _relations_sync
 from tests.base import BaseTestCase
 from tests.mocks.requests import ErrorResponse
 from tests.mocks.requests import MockRequests
@@ -81,3 +86,102 @@ class SyncTestCase(BaseTestCase):
             error,
             exc_info=True,
         )
+
+
+class RelationsSyncTestCase(BaseTestCase):
+    # Somewhere in the Pacific, far from any real zipcode.
+    LATITUDE = 10.0
+    LONGITUDE = -150.0
+
+    def setUp(self):
+        super().setUp()
+        self.city = City(name="Relations Sync Test", state_code="ZZ")
+        db.session.add(self.city)
+        db.session.commit()
+        self.addCleanup(self._cleanup)
+        self._num_zipcodes = 0
+
+    def _cleanup(self):
+        sensor_ids = [s.id for s in Sensor.query.filter(Sensor.id >= 999000000)]
+        SensorZipcodeRelation.query.filter(
+            SensorZipcodeRelation.sensor_id.in_(sensor_ids)
+        ).delete(synchronize_session=False)
+        Sensor.query.filter(Sensor.id.in_(sensor_ids)).delete(synchronize_session=False)
+        Zipcode.query.filter_by(city_id=self.city.id).delete()
+        City.query.filter_by(id=self.city.id).delete()
+        db.session.commit()
+
+    @staticmethod
+    def _geohash_bits(gh: str) -> typing.Dict[str, str]:
+        return dict(zip(GEOHASH_BIT_NAMES, gh))
+
+    def _create_sensor(self, sensor_id: int, gh: str) -> Sensor:
+        sensor = Sensor(
+            id=sensor_id,
+            latest_reading=10.0,
+            updated_at=self.timestamp,
+            latitude=self.LATITUDE,
+            longitude=self.LONGITUDE,
+            **self._geohash_bits(gh),
+        )
+        db.session.add(sensor)
+        return sensor
+
+    def _create_zipcodes(
+        self, gh: str, distances: typing.List[float]
+    ) -> typing.Dict[Zipcode, float]:
+        """Creates zipcodes due north of the sensor at the given distances in km."""
+        zipcodes = {}
+        for distance in distances:
+            self._num_zipcodes += 1
+            zipcode = Zipcode(
+                zipcode=f"T{self._num_zipcodes:04}",
+                city_id=self.city.id,
+                latitude=self.LATITUDE + math.degrees(distance / 6371),
+                longitude=self.LONGITUDE,
+                **self._geohash_bits(gh),
+            )
+            db.session.add(zipcode)
+            zipcodes[zipcode] = distance
+        return zipcodes
+
+    def _assert_relations(self, sensor_id: int, expected: typing.Dict[Zipcode, float]):
+        relations = {
+            r.zipcode_id: r.distance
+            for r in SensorZipcodeRelation.query.filter_by(sensor_id=sensor_id)
+        }
+        self.assertSetEqual({z.id for z in expected}, set(relations))
+        for zipcode, distance in expected.items():
+            self.assertAlmostEqual(distance, relations[zipcode.id], places=6)
+
+    def test_relations_sync_caps_at_prefix_boundary(self):
+        sensor = self._create_sensor(999000001, "zzzzzzzzzzzz")
+        # 10 zipcodes share the sensor's full geohash, and 15 more share all but
+        # its last character, so we hit the cap of 25 exactly as that prefix runs out.
+        full_prefix = self._create_zipcodes(
+            "zzzzzzzzzzzz", [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+        )
+        eleven_prefix = self._create_zipcodes(
+            "zzzzzzzzzzzy", [2, 4, 6, 8, 10, 12, 14, 16, 18, 20, 21, 22, 23, 24, 24.5]
+        )
+        # The next prefix has zipcodes closer than any of the above, plus some
+        # beyond 25km, but we're already at the cap.
+        self._create_zipcodes("zzzzzzzzzzyz", [0.5, 1.5, 2.5, 26, 30, 50])
+        db.session.commit()
+
+        _relations_sync([sensor.id])
+
+        self._assert_relations(sensor.id, {**full_prefix, **eleven_prefix})
+
+    def test_relations_sync_stops_at_distance_cutoff(self):
+        sensor = self._create_sensor(999000002, "yyyyyyyyyyyy")
+        # Only zipcodes within 25km are related, and once one is left out we
+        # don't widen the prefix, even though the next one has a closer zipcode.
+        nearby = self._create_zipcodes("yyyyyyyyyyyy", [5, 10, 15])
+        self._create_zipcodes("yyyyyyyyyyyy", [26, 30, 40])
+        self._create_zipcodes("yyyyyyyyyyyz", [1])
+        db.session.commit()
+
+        _relations_sync([sensor.id])
+
+        self._assert_relations(sensor.id, nearby)
@@ -0,0 +1,48 @@
+import typing
+
+from airq.lib.trie import Trie
+from tests.base import BaseTestCase
+
+
+class TrieTestCase(BaseTestCase):
+    @staticmethod
+    def _get_trie() -> Trie[str]:
+        trie: Trie[str] = Trie()
+        for key in ["", "a", "ab", "abc", "abd", "abcd", "ac", "acd", "b", "bc"]:
+            trie.insert(key, key)
+        return trie
+
+    def _assert_matches_get(self, trie: Trie[str], key: str):
+        yielded = list(trie.iter_prefixes(key))
+        seen: typing.List[str] = []
+        expected = []
+        for i in range(len(key), 0, -1):
+            values = sorted(v for v in trie.get(key[:i]) if v not in seen)
+            seen.extend(values)
+            if values:
+                expected.append(values)
+        self.assertListEqual(expected, [sorted(values) for values in yielded if values])
+        flattened = [v for values in yielded for v in values]
+        self.assertEqual(len(set(flattened)), len(flattened))
+        self.assertListEqual(sorted(trie.get(key[:1])), sorted(flattened))
+
+    def test_iter_prefixes(self):
+        trie = self._get_trie()
+        self._assert_matches_get(trie, "abcd")
+        self.assertListEqual(
+            [["abcd"], ["abc"], ["ab", "abd"], ["a", "ac", "acd"]],
+            [sorted(values) for values in trie.iter_prefixes("abcd")],
+        )
+
+    def test_iter_prefixes_diverges(self):
+        trie = self._get_trie()
+        self._assert_matches_get(trie, "abx")
+        self.assertListEqual(
+            [["ab", "abc", "abcd", "abd"], ["a", "ac", "acd"]],
+            [sorted(values) for values in trie.iter_prefixes("abx")],
+        )
+
+    def test_iter_prefixes_missing_first_character(self):
+        trie = self._get_trie()
+        self._assert_matches_get(trie, "xyz")
+        self.assertListEqual([], list(trie.iter_prefixes("xyz")))
@@ -1,4 +1,7 @@
+from airq.config import db
+from airq.lib.geo import GEOHASH_BIT_NAMES
 from airq.lib.readings import ConversionStrategy
+from airq.models import zipcodes
 from airq.models.zipcodes import Zipcode
 from tests.base import BaseTestCase
 
@@ -52,3 +55,43 @@ class ZipcodeTestCase(BaseTestCase):
             ],
             zipcode.get_recommendations(3, ConversionStrategy.NONE),
         )
+
+    def test_get_by_zipcode_repeat_lookup(self):
+        zipcodes._zipcode_ids.clear()
+        zipcode = Zipcode.query.get_by_zipcode("97204")
+        self.assertEqual("97204", zipcode.zipcode)
+        self.assertEqual(zipcode.id, zipcodes._zipcode_ids["97204"])
+        self.assertEqual(zipcode, Zipcode.query.get_by_zipcode("97204"))
+
+    def test_get_by_zipcode_after_delete(self):
+        existing = Zipcode.query.filter_by(zipcode="97204").first()
+        zipcode = Zipcode(
+            zipcode="T0000",
+            city_id=existing.city_id,
+            latitude=existing.latitude,
+            longitude=existing.longitude,
+            **{name: getattr(existing, name) for name in GEOHASH_BIT_NAMES},
+        )
+        db.session.add(zipcode)
+        db.session.commit()
+        self.addCleanup(self._delete_zipcode, "T0000")
+        self.assertEqual(zipcode, Zipcode.query.get_by_zipcode("T0000"))
+        self.assertIn("T0000", zipcodes._zipcode_ids)
+
+        db.session.delete(zipcode)
+        db.session.commit()
+        self.assertIsNone(Zipcode.query.get_by_zipcode("T0000"))
+        self.assertNotIn("T0000", zipcodes._zipcode_ids)
+
+    def test_get_by_zipcode_with_reused_id(self):
+        # Simulate the cached ID now belonging to a different zipcode.
+        other = Zipcode.query.filter_by(zipcode="97038").first()
+        zipcodes._zipcode_ids["97204"] = other.id
+        zipcode = Zipcode.query.get_by_zipcode("97204")
+        self.assertEqual("97204", zipcode.zipcode)
+        self.assertEqual(zipcode.id, zipcodes._zipcode_ids["97204"])
+
+    @staticmethod
+    def _delete_zipcode(zipcode: str):
+        Zipcode.query.filter_by(zipcode=zipcode).delete()
+        db.session.commit()